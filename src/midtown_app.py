@@ -23,13 +23,40 @@ Icons: Designed by Freepik - www.freepik.com
 GitHub Repository: https://github.com/LukeWait/gui-app-switcher-midtown
 """
 
+import concurrent.futures
+import functools
 import os
+import re
+import string
 import sys
+import threading
 import customtkinter as ctk
-from tkinter import *
-from CTkToolTip import *
+from tkinter import END, NONE, WORD
+from CTkToolTip import CTkToolTip
 from PIL import Image
 
+# Characters removed from Caesar Cipher input, see CaesarCipher.caesar_cipher()
+_NON_ALPHA = re.compile(r"[^A-Z]")
+
+# Strings accepted by int(), see MultiplicationTable.is_number() and CaesarCipher.validate_key()
+# int() strips whitespace other than the \x1c-\x1f separators that \s also matches
+_INTEGER = re.compile(r"[^\S\x1c-\x1f]*[-+]?\d+(?:_\d+)*[^\S\x1c-\x1f]*")
+
+# Start of the error message listing invalid input fields
+_ERR_PREFIX = "Input Error: Please ensure all fields have correct input\nFields: "
+
+# Font files registered by Gui.load_fonts()
+_FONT_FILES = (
+    "Fascinate-Regular.ttf",
+    "BRITANIC.ttf",
+    "CaesarDressing-Regular.ttf",
+    "Rubik-Italic-VariableFont_wght.ttf",
+    "Rubik-VariableFont_wght.ttf",
+    "Silkscreen-Bold.ttf",
+    "Silkscreen-Regular.ttf"
+)
+
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -38,6 +65,63 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Define paths to various resource directories once at import
+if hasattr(sys, '_MEIPASS'):
+    # In a PyInstaller bundle, use paths relative to the _MEIPASS directory
+    _IMAGES_PATH = resource_path(os.path.join("assets", "images"))
+    _FONTS_PATH = resource_path(os.path.join("assets", "fonts"))
+else:
+    # In development, use paths relative to the script's directory
+    _IMAGES_PATH = resource_path(os.path.join("..", "assets", "images"))
+    _FONTS_PATH = resource_path(os.path.join("..", "assets", "fonts"))
+
+
+@functools.lru_cache(maxsize=None)
+def _decode(path, size):
+    """Decodes an image file resampled down to a source size, caching the result by path and size.
+
+    The source size is the displayed size multiplied by the display scaling. Images no larger
+    than the source size are kept at full size rather than upscaled. Only the resampled image
+    is kept, the full size decode is released once resized.
+
+    Args:
+        path (str): Path to the image file.
+        size (tuple): The (width, height) in pixels to resample the image down to.
+
+    Returns:
+        image (PIL.Image.Image): The decoded RGBA image at the source size, or at full size.
+    """
+    with Image.open(path) as image:
+        # Lets formats that support it (e.g. JPEG) decode at a reduced scale
+        image.draft("RGBA", size)
+        image = image.convert("RGBA")
+    if image.width > size[0] or image.height > size[1]:
+        image = image.resize(size, Image.LANCZOS)
+    return image
+
+
+class _FocusCommand:
+    """Widget command that focuses a widget before calling an action.
+
+    Attributes:
+        widget (ctk.CTkBaseClass): The widget to take focus, usually the widget clicked.
+        action (callable): The action to call with any arguments passed by the widget.
+    """
+    __slots__ = ("widget", "action")
+
+    def __init__(self, widget, action):
+        self.widget = widget
+        self.action = action
+
+    def __call__(self, *args):
+        self.widget.focus_set()
+        return self.action(*args)
+
+    def on_event(self, event):
+        """Calls the command from an event binding, discarding the event."""
+        return self()
+
+
 class Gui(ctk.CTk):
     """Represents the graphical user interface.
 
@@ -68,6 +152,20 @@ class Gui(ctk.CTk):
         update_mt_slider(): Updates the displayed tooltip value of the Multiplication Table range slider.
     """
 
+    # Constants for colors
+    DARKNESS = "#202020"
+    MIDNESS = "#303030"
+    LIGHTNESS = "#404040"
+    BLUE = "#1f538d"
+    GREEN = "#4e9a06"
+    RED = "#cc0000"
+
+    # Text color of each type of msg, see update_msg()
+    _MSG_COLORS = {"error": RED, "system": GREEN}
+
+    # Rock Paper Scissors choices with a player image
+    _RPS_VALID = frozenset(("Rock", "Paper", "Scissors"))
+
     def __init__(self):
         """Initializes the Gui object, sets up the main window, loads images, and creates frames.
 
@@ -75,15 +173,10 @@ class Gui(ctk.CTk):
         """
         super().__init__()
         
-        # Constants for colors
-        self.DARKNESS = "#202020"
-        self.MIDNESS = "#303030"
-        self.LIGHTNESS = "#404040"
-        self.DARK_BLUE = "#?"
-        self.BLUE = "#1f538d"
-        self.LIGHT_BLUE = "#3a7ebf"
-        self.GREEN = "#4e9a06"
-        self.RED = "#cc0000"
+        # Entry validation command shared by all entries, limits input to 12 characters.
+        # Defined as a Tcl proc so keystrokes are validated without calling into Python
+        self.tk.eval("proc _maxlen {s n} {expr {[string length $s] <= $n}}")
+        self._len12_cmd = ("_maxlen", "%P", 12)
         
         # customtkinter appearance settings
         ctk.set_appearance_mode("dark")
@@ -100,47 +193,83 @@ class Gui(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
-        # Define paths to various resource directories
-        if hasattr(sys, '_MEIPASS'):
-            # In a PyInstaller bundle, use paths relative to the _MEIPASS directory
-            self.images_path = resource_path(os.path.join("assets", "images"))
-            self.fonts_path = resource_path(os.path.join("assets", "fonts"))
-        else:
-            # In development, use paths relative to the script's directory
-            self.images_path = resource_path(os.path.join("..", "assets", "images"))
-            self.fonts_path = resource_path(os.path.join("..", "assets", "fonts"))
+        # Paths to various resource directories
+        self.images_path = _IMAGES_PATH
+        self.fonts_path = _FONTS_PATH
 
         # Dictionaries of solution icons, buttons, and rps images
         self.icons = {}
         self.menu_buttons = {}
         self.rps_images = {}
 
-        # Load images and fonts
+        # Load fonts in the background while images are loaded, font files are only
+        # registered with the OS by FontManager so no Tk calls leave the main thread
+        self._font_thread = threading.Thread(target=self.load_fonts, daemon=True)
+        self._font_thread.start()
         self.load_images()
-        self.load_fonts()
+        self._font_thread.join()
+
+        # Cache of CTkFont objects shared between widgets, see _font()
+        self._fonts = {}
 
         # Create and show frames
         self.create_menu_frame()
         self.create_main_frame()
         self.create_title_frame()
-        self.create_rps_frame()
-        self.create_mt_frame()
-        self.create_cc_frame()
+
+        # Solution frames are built on first selection, see show_solution()
+        self._frame_builders = {
+            "Rock Paper Scissors": self.create_rps_frame,
+            "Multiplication Table": self.create_mt_frame,
+            "Caesar Cipher": self.create_cc_frame
+        }
+        self._solution_frames = {}
+        
+        # Handlers of each Rock Paper Scissors screen, see switch_rps_frame()
+        self._rps_screens = {
+            "login": self._show_rps_login,
+            "game": self._show_rps_game,
+            "postgame": self._show_rps_postgame
+        }
+        
+        # Msg labels of built solution frames, see update_msg()
+        self._msg_labels = {}
+        
+        # Title fonts of each solution
+        self._title_fonts = {
+            "Rock Paper Scissors": self._font("Silkscreen", 33, "bold"),
+            "Multiplication Table": self._font("Britannic Bold", 38),
+            "Caesar Cipher": self._font("Caesar Dressing", 36)
+        }
+        # Title frame icon of each solution, solutions without a loaded icon are left out
+        self._title_icons = {title: sizes[(50, 50)] for title, sizes in self.icons.items()}
        
     def load_fonts(self):
         """Loads fonts used in the GUI from specified directories.
         """
         try:
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "Fascinate-Regular.ttf"))
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "BRITANIC.ttf"))
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "CaesarDressing-Regular.ttf"))
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "Rubik-Italic-VariableFont_wght.ttf"))
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "Rubik-VariableFont_wght.ttf"))
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "Silkscreen-Bold.ttf"))
-            ctk.FontManager.load_font(os.path.join(self.fonts_path, "Silkscreen-Regular.ttf"))
+            for file_name in _FONT_FILES:
+                ctk.FontManager.load_font(os.path.join(self.fonts_path, file_name))
             
         except Exception as e:
             print(f"Error:\n{str(e)}")
+
+    def _font(self, family, size, weight="normal"):
+        """Returns a shared CTkFont, creating it on first use.
+
+        Args:
+            family (str): The font family name.
+            size (int): The font size in pixels.
+            weight (str): The font weight ("normal", or "bold").
+
+        Returns:
+            font (ctk.CTkFont): The font matching the given family, size and weight.
+        """
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+        return font
      
     def load_images(self):
         """Loads images used in the GUI from specified directories.
@@ -156,29 +285,50 @@ class Gui(ctk.CTk):
             # Define the icon sizes you need
             icon_sizes = [(30, 30), (50, 50)]
             
+            # Define the player names (left and right) and gesture names
+            player_names = ["p1", "p2"]
+            gesture_names = ["Rock", "Paper", "Scissors"]
+            
+            # Build the path of every solution icon, player and gesture image once
+            paths = {solution: os.path.join(self.images_path, file_name)
+                     for solution, file_name in solutions.items()}
+            gesture_paths = {(player, gesture): os.path.join(self.images_path, 
+                                                             f"{gesture.lower()}-{player}.png")
+                             for player in player_names for gesture in gesture_names}
+
+            # CTkImage rescales images by the widget scaling when drawn, so images are resampled
+            # to their displayed size at the current scaling, with headroom for a 200% display
+            scaling = max(ctk.ScalingTracker.get_widget_scaling(self), 2.0)
+            icon_source_size = tuple(round(length * scaling) for length in max(icon_sizes))
+            gesture_source_size = (round(180 * scaling), round(180 * scaling))
+            
+            # Decode every file in parallel, PIL releases the GIL while decoding. Icons are 
+            # resampled once for the largest icon size and shared between all icon sizes
+            tasks = [(path, icon_source_size) for path in paths.values()]
+            tasks += [(path, gesture_source_size) for path in gesture_paths.values()]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                decoded = dict(zip(tasks, executor.map(lambda task: _decode(*task), tasks)))
+            
+            # CTkImage objects are created on the main thread from the decoded images
             # Loop through the solutions and icon sizes to populate the nested dictionary
-            for solution, file_name in solutions.items():
+            for solution, path in paths.items():
+                image = decoded[(path, icon_source_size)]
                 solution_icons = {}
                 for size in icon_sizes:
-                    icon = ctk.CTkImage(Image.open(os.path.join(self.images_path, file_name)), 
-                                        size=size)
+                    icon = ctk.CTkImage(image, size=size)
                     solution_icons[size] = icon
                 self.icons[solution] = solution_icons
 
-            # Define the player names (left and right) and their corresponding file names
-            player_names = ["p1", "p2"]
-            gesture_names = ["Rock", "Paper", "Scissors"]
-
             # Loop through the player and gesture names to populate the dictionary
             for player in player_names:
                 self.rps_images[player] = {}
                 for gesture in gesture_names:
-                    image = ctk.CTkImage(Image.open(os.path.join(self.images_path, 
-                                         f"{gesture.lower()}-{player}.png")), size=(180, 180))
+                    image = ctk.CTkImage(decoded[(gesture_paths[(player, gesture)], gesture_source_size)], 
+                                         size=(180, 180))
                     self.rps_images[player][gesture] = image
 
-            self.image_blank = ctk.CTkImage(Image.open(os.path.join(self.images_path, "blank.png")), 
-                                            size=(180, 180))
+            # Fully transparent placeholder, generated rather than loaded from file
+            self.image_blank = ctk.CTkImage(Image.new("RGBA", (180, 180), (0, 0, 0, 0)), size=(180, 180))
 
         except Exception as e:
             print(f"Error:\n{str(e)}")
@@ -194,27 +344,28 @@ class Gui(ctk.CTk):
         self.menu_frame.grid(row=0, column=0, rowspan=2, sticky="nsew")
         # Configure menu frame widgets
         self.menu_label_main = ctk.CTkLabel(self.menu_frame, text="MidTown IT", 
-                                            font=ctk.CTkFont(size=34, family="Fascinate"))
+                                            font=self._font("Fascinate", 34))
         self.menu_label_main.grid(row=0, column=0, padx=0, pady=(30, 0))
         self.menu_label_sub = ctk.CTkLabel(self.menu_frame, text="Training Solutions App", 
-                                           font=ctk.CTkFont(size=18, family="Rubik"))
+                                           font=self._font("Rubik", 18))
         self.menu_label_sub.grid(row=1, column=0, padx=0, pady=0, sticky="n")
         
-        # Create buttons for each entry in the menu_icons dictionary
-        for menu_text, icon_sizes in self.icons.items():
+        # Create buttons for each entry in the menu_icons dictionary, starting below the labels
+        menu_font = self._font("Rubik", 15)
+        for row, (menu_text, icon_sizes) in enumerate(self.icons.items(), start=2):
             menu_icon = icon_sizes[(30, 30)]
             menu_button = ctk.CTkButton(self.menu_frame, corner_radius=10, height=50,
                                         text=menu_text, fg_color=self.DARKNESS,
                                         image=menu_icon, anchor="w",
-                                        font=ctk.CTkFont(family="Rubik", size=15))
-            menu_button.grid(row=len(self.menu_buttons) + 2, column=0, padx=30, sticky="ew")
+                                        font=menu_font)
+            menu_button.grid(row=row, column=0, padx=30, sticky="ew")
             
             # Add the button to the menu_buttons dictionary
             self.menu_buttons[menu_text] = menu_button
         
         self.menu_button_exit = ctk.CTkButton(self.menu_frame, text="Exit Application", width=220, 
                                               height=50, corner_radius=30,
-                                              font=ctk.CTkFont(size=15, family="Rubik", weight="bold"))
+                                              font=self._font("Rubik", 15, "bold"))
         self.menu_button_exit.grid(row=5, column=0, padx=30, pady=30, sticky="s")
 
     def create_main_frame(self):
@@ -241,8 +392,8 @@ class Gui(ctk.CTk):
         self.title_image.grid(row=0, column=0, padx=(0, 10), pady=(10, 0), sticky="new")
         self.title_label = ctk.CTkLabel(self.title_frame, text="", anchor="w")
         self.title_label.grid(row=0, column=1, padx=(10, 0), pady=(0, 5), sticky="sew")    
-        self.title_filler = ctk.CTkLabel(self.title_frame, text="", font=ctk.CTkFont(size=1), 
-                                         height=10)
+        self.title_filler = ctk.CTkFrame(self.title_frame, corner_radius=0, height=10, 
+                                         fg_color="transparent")
         self.title_filler.grid(row=1, column=0, columnspan=2, padx=0, pady=0, sticky="nsew")
 
     def create_rps_frame(self):
@@ -256,9 +407,10 @@ class Gui(ctk.CTk):
                                       fg_color=self.MIDNESS, bg_color=self.DARKNESS)
         self.rps_frame.grid_columnconfigure(0, weight=1)
         self.rps_frame.grid_rowconfigure(1, weight=1)
-        self.rps_filler = ctk.CTkLabel(self.rps_frame, text="", font=ctk.CTkFont(size=1), 
-                                       height=5, fg_color=self.DARKNESS)
+        self.rps_filler = ctk.CTkFrame(self.rps_frame, corner_radius=0, height=5, 
+                                       fg_color=self.DARKNESS)
         self.rps_filler.grid(row=0, column=0, padx=0, pady=0, sticky="new")
+        self._solution_frames["Rock Paper Scissors"] = self.rps_frame
         
         # Configure login frame
         self.rps_frame_login = ctk.CTkFrame(self.rps_frame, corner_radius=0, fg_color=self.MIDNESS)
@@ -267,22 +419,22 @@ class Gui(ctk.CTk):
         self.rps_frame_login.grid_rowconfigure((0, 1), weight=1)
         # Configure login frame widgets
         self.rps_label_player1 = ctk.CTkLabel(self.rps_frame_login, text="PLAYER 1", 
-                                              font=ctk.CTkFont(size=22, family="Silkscreen", weight="bold"))
+                                              font=self._font("Silkscreen", 22, "bold"))
         self.rps_label_player1.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="s")
         self.rps_label_player2 = ctk.CTkLabel(self.rps_frame_login, text="PLAYER 2", 
-                                              font=ctk.CTkFont(size=22, family="Silkscreen", weight="bold"))
+                                              font=self._font("Silkscreen", 22, "bold"))
         self.rps_label_player2.grid(row=0, column=1, padx=10, pady=(10, 0), sticky="s")
         self.rps_entry_p1name = ctk.CTkEntry(self.rps_frame_login, fg_color=self.DARKNESS, width=180, 
                                              justify="center", text_color=self.GREEN, 
-                                             font=ctk.CTkFont(size=14, family="Silkscreen"), 
+                                             font=self._font("Silkscreen", 14), 
                                              placeholder_text="P1 Name here", validate="key", 
-                                             validatecommand=(self.register(lambda P: len(P) <= 12), "%P"))
+                                             validatecommand=self._len12_cmd)
         self.rps_entry_p1name.grid(row=1, column=0, padx=10, pady=10, sticky="n")
         self.rps_entry_p2name = ctk.CTkEntry(self.rps_frame_login, fg_color=self.DARKNESS, width=180, 
                                              justify="center", text_color=self.GREEN,
-                                             font=ctk.CTkFont(size=14, family="Silkscreen"),
+                                             font=self._font("Silkscreen", 14),
                                              placeholder_text="P2 Name here", validate="key", 
-                                             validatecommand=(self.register(lambda P: len(P) <= 12), "%P"))
+                                             validatecommand=self._len12_cmd)
         self.rps_entry_p2name.grid(row=1, column=1, padx=10, pady=10, sticky="n")
         
         # Configure login msg frame
@@ -293,14 +445,14 @@ class Gui(ctk.CTk):
         self.rps_frame_login_msg.grid_rowconfigure(1, weight=1)
         # Configure login msg frame widgets
         self.rps_msg_login = ctk.CTkLabel(self.rps_frame_login_msg, text_color=self.GREEN,
-                                          font=ctk.CTkFont(size=14, family="Silkscreen"),
+                                          font=self._font("Silkscreen", 14),
                                           text="Welcome to the Rock Paper Scissors game\n" +
                                                "Please enter a name for P1 and P2")
         self.rps_msg_login.grid(row=0, column=0, padx=10, pady=(20, 10), sticky="")
         self.rps_button_start = ctk.CTkButton(self.rps_frame_login_msg, corner_radius=10, height=50, 
                                               text="Start Game", fg_color=self.LIGHTNESS,
                                               hover_color=self.GREEN, 
-                                              font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                              font=self._font("Silkscreen", 14))
         self.rps_button_start.grid(row=1, column=0, padx=10, pady=(10, 20))
         
         # Configure game frame
@@ -309,16 +461,16 @@ class Gui(ctk.CTk):
         self.rps_frame_game.grid_rowconfigure((0, 3), weight=1)
         # Configure game frame widgets
         self.rps_label_p1name = ctk.CTkLabel(self.rps_frame_game, text="", 
-                                             font=ctk.CTkFont(size=22, family="Silkscreen", weight="bold"))
+                                             font=self._font("Silkscreen", 22, "bold"))
         self.rps_label_p1name.grid(row=0, column=0, padx=0, pady=(10, 0), sticky="s")
         self.rps_label_p1score = ctk.CTkLabel(self.rps_frame_game, text="Score: 0", width=200,
-                                              font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                              font=self._font("Silkscreen", 14))
         self.rps_label_p1score.grid(row=1, column=0, padx=0, pady=0, sticky="")
         self.rps_label_p2name = ctk.CTkLabel(self.rps_frame_game, text="", 
-                                             font=ctk.CTkFont(size=22, family="Silkscreen", weight="bold"))
+                                             font=self._font("Silkscreen", 22, "bold"))
         self.rps_label_p2name.grid(row=0, column=2, padx=0, pady=(10, 0), sticky="s")
         self.rps_label_p2score = ctk.CTkLabel(self.rps_frame_game, text="Score: 0", width=200,
-                                              font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                              font=self._font("Silkscreen", 14))
         self.rps_label_p2score.grid(row=1, column=2, padx=0, pady=0, sticky="")   
         self.rps_frame_p1choice = ctk.CTkFrame(self.rps_frame_game, corner_radius=10)
         self.rps_frame_p1choice.grid(row=2, column=0, padx=10, pady=(5, 10))
@@ -326,7 +478,7 @@ class Gui(ctk.CTk):
                                                text_color=self.GREEN, image=self.image_blank)
         self.rps_image_p1choice.grid(row=0, column=0, padx=10, pady=10)
         self.rps_label_vs = ctk.CTkLabel(self.rps_frame_game, text="Vs", 
-                                         font=ctk.CTkFont(size=33, family="Silkscreen", weight="bold"))
+                                         font=self._font("Silkscreen", 33, "bold"))
         self.rps_label_vs.grid(row=2, column=1, padx=0, pady=10)
         self.rps_frame_p2choice = ctk.CTkFrame(self.rps_frame_game, corner_radius=10)
         self.rps_frame_p2choice.grid(row=2, column=2, padx=10, pady=(5, 10))
@@ -334,12 +486,12 @@ class Gui(ctk.CTk):
                                                text_color=self.GREEN, image=self.image_blank)
         self.rps_image_p2choice.grid(row=0, column=0, padx=10, pady=10)
         self.rps_segbutton_p1 = ctk.CTkSegmentedButton(self.rps_frame_game, width=200,
-                                                       font=ctk.CTkFont(size=14, family="Silkscreen"),
+                                                       font=self._font("Silkscreen", 14),
                                                        unselected_hover_color=self.GREEN,
                                                        values=["Rock", "Paper", "Scissors"])
         self.rps_segbutton_p1.grid(row=3, column=0, padx=0, pady=(0, 10), sticky="n")
         self.rps_segbutton_p2 = ctk.CTkSegmentedButton(self.rps_frame_game, width=200,
-                                                       font=ctk.CTkFont(size=14, family="Silkscreen"),
+                                                       font=self._font("Silkscreen", 14),
                                                        unselected_hover_color=self.GREEN,
                                                        values=["Rock", "Paper", "Scissors"])
         self.rps_segbutton_p2.grid(row=3, column=2, padx=0, pady=(0, 10), sticky="n")
@@ -352,12 +504,12 @@ class Gui(ctk.CTk):
         # Configure game msg frame widgets
         self.rps_msg_game = ctk.CTkLabel(self.rps_frame_game_msg, text_color=self.GREEN,
                                          text="P1 and P2 make your selection\nNo Peaking!",
-                                         font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                         font=self._font("Silkscreen", 14))
         self.rps_msg_game.grid(row=0, column=0, padx=10, pady=(20, 10), sticky="")
         self.rps_button_quit1 = ctk.CTkButton(self.rps_frame_game_msg, corner_radius=10, height=50, 
                                               fg_color=self.LIGHTNESS, 
                                               hover_color=self.RED, text="Quit Game",
-                                              font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                              font=self._font("Silkscreen", 14))
         self.rps_button_quit1.grid(row=1, column=0, padx=10, pady=(10, 20), sticky="")
         
         # Configure postgame msg frame
@@ -367,19 +519,40 @@ class Gui(ctk.CTk):
         self.rps_frame_postgame_msg.grid_rowconfigure(1, weight=1)
         # Configure postgame msg frame widgets
         self.rps_msg_postgame = ctk.CTkLabel(self.rps_frame_postgame_msg, text_color=self.GREEN,
-                                             font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                             font=self._font("Silkscreen", 14))
         self.rps_msg_postgame.grid(row=0, column=0, columnspan=2, padx=10, pady=(20, 10), sticky="")
         self.rps_button_quit2 = ctk.CTkButton(self.rps_frame_postgame_msg, corner_radius=10,
                                               height=50, fg_color=self.LIGHTNESS, 
                                               hover_color=self.RED, text="Quit Game", 
-                                              font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                              font=self._font("Silkscreen", 14))
         self.rps_button_quit2.grid(row=1, column=0, padx=10, pady=(10, 20), sticky="e")
         self.rps_button_replay = ctk.CTkButton(self.rps_frame_postgame_msg, corner_radius=10, 
                                                height=50, fg_color=self.LIGHTNESS, 
                                                hover_color=self.GREEN, text="Play Again", 
-                                               font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                               font=self._font("Silkscreen", 14))
         self.rps_button_replay.grid(row=1, column=1, padx=10, pady=(10, 20), sticky="w")
         
+        # Msg labels used by update_msg()
+        self._msg_labels["rps_login"] = self.rps_msg_login
+        self._msg_labels["rps_game"] = self.rps_msg_game
+        self._msg_labels["rps_postgame"] = self.rps_msg_postgame
+        
+        # Player widgets and image label configurations used by the update_rps_* methods
+        self._rps_image_labels = {"p1": self.rps_image_p1choice, "p2": self.rps_image_p2choice}
+        self._rps_name_labels = {"p1": self.rps_label_p1name, "p2": self.rps_label_p2name}
+        self._rps_score_labels = {"p1": self.rps_label_p1score, "p2": self.rps_label_p2score}
+        self._rps_segbuttons = {"p1": self.rps_segbutton_p1, "p2": self.rps_segbutton_p2}
+        self._rps_image_configs = {}
+        for player in self._rps_image_labels:
+            configs = {
+                "Waiting": {"text": "Waiting for input...", "image": self.image_blank,
+                            "font": self._font("Silkscreen", 14)},
+                "?": {"text": "?", "font": self._font("Silkscreen", 50, "bold")}
+            }
+            for gesture in self._RPS_VALID:
+                configs[gesture] = {"text": "", "image": self.rps_images[player][gesture]}
+            self._rps_image_configs[player] = configs
+        
     def create_mt_frame(self):
         """Creates and configures the Multiplication Table frame.
         
@@ -390,9 +563,10 @@ class Gui(ctk.CTk):
                                      fg_color=self.MIDNESS, bg_color=self.DARKNESS)
         self.mt_frame.grid_columnconfigure(0, weight=1)
         self.mt_frame.grid_rowconfigure(1, weight=1)
-        self.mt_filler = ctk.CTkLabel(self.mt_frame, text="", font=ctk.CTkFont(size=1), 
-                                      height=5, fg_color=self.DARKNESS)
+        self.mt_filler = ctk.CTkFrame(self.mt_frame, corner_radius=0, height=5, 
+                                      fg_color=self.DARKNESS)
         self.mt_filler.grid(row=0, column=0, padx=0, pady=0, sticky="new")
+        self._solution_frames["Multiplication Table"] = self.mt_frame
         
         # Configure main frame
         self.mt_frame_main = ctk.CTkFrame(self.mt_frame, corner_radius=0, fg_color=self.MIDNESS)
@@ -401,38 +575,39 @@ class Gui(ctk.CTk):
         self.mt_frame_main.grid_rowconfigure((0, 2, 4, 6), weight=1)
         # Configure main frame widgets
         self.mt_label_user = ctk.CTkLabel(self.mt_frame_main, text="Username", 
-                                          font=ctk.CTkFont(size=24, family="Britannic Bold"))
+                                          font=self._font("Britannic Bold", 24))
         self.mt_label_user.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="s")
         self.mt_entry_user = ctk.CTkEntry(self.mt_frame_main, fg_color=self.DARKNESS, width=180, 
                                           justify="center", text_color=self.GREEN, 
-                                          font=ctk.CTkFont(size=14, family="Silkscreen"), 
+                                          font=self._font("Silkscreen", 14), 
                                           placeholder_text="Enter name", validate="key", 
-                                          validatecommand=(self.register(lambda P: len(P) <= 12), "%P"))
+                                          validatecommand=self._len12_cmd)
         self.mt_entry_user.grid(row=1, column=0, padx=10, pady=10) 
         self.mt_label_multiplier = ctk.CTkLabel(self.mt_frame_main, text="Multiplier", 
-                                                font=ctk.CTkFont(size=24, family="Britannic Bold"))
+                                                font=self._font("Britannic Bold", 24))
         self.mt_label_multiplier.grid(row=2, column=0, padx=10, pady=(10, 0), sticky="s")
         self.mt_entry_multiplier = ctk.CTkEntry(self.mt_frame_main, fg_color=self.DARKNESS, width=180, 
                                                 justify="center", text_color=self.GREEN, 
-                                                font=ctk.CTkFont(size=14, family="Silkscreen"), 
+                                                font=self._font("Silkscreen", 14), 
                                                 placeholder_text="Enter number", validate="key", 
-                                                validatecommand=(self.register(lambda P: len(P) <= 12), "%P"))
+                                                validatecommand=self._len12_cmd)
         self.mt_entry_multiplier.grid(row=3, column=0, padx=10, pady=10)
         self.mt_label_multiplicand = ctk.CTkLabel(self.mt_frame_main, text="Multiplicand Range", 
-                                           font=ctk.CTkFont(size=24, family="Britannic Bold"))
+                                           font=self._font("Britannic Bold", 24))
         self.mt_label_multiplicand.grid(row=4, column=0, padx=10, pady=(10, 0), sticky="s")
         self.mt_slider_multiplicand = ctk.CTkSlider(self.mt_frame_main, from_=1, to=24, number_of_steps=24, 
                                                     width=180, command=self.update_mt_slider)
         self.mt_slider_multiplicand.grid(row=5, column=0, padx=10, pady=(10, 5))
-        self.mt_slider_tooltip = CTkToolTip(self.mt_slider_multiplicand, message="12",
-                                            font=ctk.CTkFont(size=10, family="Silkscreen"))
+        # Tooltip is created on first hover, see _ensure_mt_tooltip()
+        self.mt_slider_tooltip = None
+        self.mt_slider_multiplicand.bind("<Enter>", self._ensure_mt_tooltip, add="+")
         self.mt_label_multiplicand = ctk.CTkLabel(self.mt_frame_main, width=180, 
                                            text="1              12            24", 
-                                           font=ctk.CTkFont(size=10, family="Silkscreen"))
+                                           font=self._font("Silkscreen", 10))
         self.mt_label_multiplicand.grid(row=6, column=0, padx=10, pady=(0, 10), sticky="n")
         self.mt_textbox = ctk.CTkTextbox(self.mt_frame_main, state="disabled", wrap=NONE, width=500,
                                          fg_color=self.DARKNESS, text_color=self.GREEN, 
-                                         font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                         font=self._font("Silkscreen", 14))
         self.mt_textbox.grid(row=0, column=1, rowspan=7, padx=(0, 10), pady=10, sticky="nsw")
         
         # Configure msg frame
@@ -445,12 +620,13 @@ class Gui(ctk.CTk):
         self.mt_msg = ctk.CTkLabel(self.mt_frame_msg, text_color=self.GREEN,
                                    text="Welcome to the Multiplication Table generator\n" +
                                         "Enter the details to be used",
-                                   font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                   font=self._font("Silkscreen", 14))
         self.mt_msg.grid(row=0, column=0, padx=10, pady=(20, 10), sticky="")
+        self._msg_labels["mt"] = self.mt_msg
         self.mt_button_generate = ctk.CTkButton(self.mt_frame_msg, corner_radius=10, height=50, 
                                                 text="Generate", fg_color=self.LIGHTNESS,
                                                 hover_color=self.GREEN, 
-                                                font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                                font=self._font("Silkscreen", 14))
         self.mt_button_generate.grid(row=1, column=0, padx=10, pady=(10, 20))
           
     def create_cc_frame(self):
@@ -461,9 +637,10 @@ class Gui(ctk.CTk):
                                      fg_color=self.MIDNESS, bg_color=self.DARKNESS)
         self.cc_frame.grid_columnconfigure(0, weight=1)
         self.cc_frame.grid_rowconfigure(1, weight=1)
-        self.cc_filler = ctk.CTkLabel(self.cc_frame, text="", font=ctk.CTkFont(size=1), 
-                                      height=5, fg_color=self.DARKNESS)
+        self.cc_filler = ctk.CTkFrame(self.cc_frame, corner_radius=0, height=5, 
+                                      fg_color=self.DARKNESS)
         self.cc_filler.grid(row=0, column=0, padx=0, pady=0, sticky="new")
+        self._solution_frames["Caesar Cipher"] = self.cc_frame
         
         # Configure main frame
         self.cc_frame_main = ctk.CTkFrame(self.cc_frame, corner_radius=0, fg_color=self.MIDNESS)
@@ -472,27 +649,29 @@ class Gui(ctk.CTk):
         self.cc_frame_main.grid_rowconfigure(1, weight=1)
         # Configure main frame widgets
         self.cc_label_ptext = ctk.CTkLabel(self.cc_frame_main, text="Plaintext", width=500,
-                                           font=ctk.CTkFont(size=23, family="Caesar Dressing"))
+                                           font=self._font("Caesar Dressing", 23))
         self.cc_label_ptext.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="e")
         self.cc_label_ctext = ctk.CTkLabel(self.cc_frame_main, text="Ciphertext", width=500,
-                                           font=ctk.CTkFont(size=23, family="Caesar Dressing"))
+                                           font=self._font("Caesar Dressing", 23))
         self.cc_label_ctext.grid(row=0, column=1, padx=10, pady=(10, 0), sticky="w")
         self.cc_textbox_ptext = ctk.CTkTextbox(self.cc_frame_main, wrap=WORD, width=500,
                                                fg_color=self.DARKNESS, text_color=self.GREEN, 
-                                               font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                               font=self._font("Silkscreen", 14))
         self.cc_textbox_ptext.grid(row=1, column=0, padx=10, pady=10, sticky="nse")
         self.cc_textbox_ctext = ctk.CTkTextbox(self.cc_frame_main, wrap=WORD, width=500,
                                                fg_color=self.DARKNESS, text_color=self.GREEN, 
-                                               font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                               font=self._font("Silkscreen", 14))
         self.cc_textbox_ctext.grid(row=1, column=1, padx=10, pady=10, sticky="nsw")
+        # Output textboxes used by update_cc_textbox()
+        self._cc_textboxes = {"ptext": self.cc_textbox_ptext, "ctext": self.cc_textbox_ctext}
         self.cc_label_key = ctk.CTkLabel(self.cc_frame_main, text="Cipher Key:", 
-                                         font=ctk.CTkFont(size=23, family="Caesar Dressing"))
+                                         font=self._font("Caesar Dressing", 23))
         self.cc_label_key.grid(row=2, column=0, padx=10, pady=10, sticky="e")
         self.cc_entry_key = ctk.CTkEntry(self.cc_frame_main, fg_color=self.DARKNESS, width=180, 
                                          justify="center", text_color=self.GREEN, 
-                                         font=ctk.CTkFont(size=14, family="Silkscreen"), 
+                                         font=self._font("Silkscreen", 14), 
                                          placeholder_text="Enter key", validate="key", 
-                                         validatecommand=(self.register(lambda P: len(P) <= 12), "%P"))
+                                         validatecommand=self._len12_cmd)
         self.cc_entry_key.grid(row=2, column=1, padx=10, pady=10, sticky="w")
         
         # Configure msg frame
@@ -505,49 +684,44 @@ class Gui(ctk.CTk):
         self.cc_msg = ctk.CTkLabel(self.cc_frame_msg, text_color=self.GREEN,
                                    text="Welcome to the Caesar Cipher encryption service\n" +
                                         "Enter text and cipher key to be used",
-                                   font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                   font=self._font("Silkscreen", 14))
         self.cc_msg.grid(row=0, column=0, columnspan=2, padx=10, pady=(20, 10), sticky="")
+        self._msg_labels["cc"] = self.cc_msg
         self.cc_button_encode = ctk.CTkButton(self.cc_frame_msg, corner_radius=10,
                                               height=50, fg_color=self.LIGHTNESS, 
                                               hover_color=self.GREEN, text="Encrypt", 
-                                              font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                              font=self._font("Silkscreen", 14))
         self.cc_button_encode.grid(row=1, column=0, padx=10, pady=(10, 20), sticky="e")
         self.cc_button_decode = ctk.CTkButton(self.cc_frame_msg, corner_radius=10, 
                                                height=50, fg_color=self.LIGHTNESS, 
                                                hover_color=self.GREEN, text="Decrypt", 
-                                               font=ctk.CTkFont(size=14, family="Silkscreen"))
+                                               font=self._font("Silkscreen", 14))
         self.cc_button_decode.grid(row=1, column=1, padx=10, pady=(10, 20), sticky="w")
     
     def show_solution(self, title):
         """Shows frames according to selected solution.
-        
-        Configures the title frame to display selected solution name, icon and font.
-        
+
+        Builds the solution frame on first use and configures the title frame
+        to display selected solution name, icon and font.
+
         Args:
             title (str): The selected solution ("Rock Paper Scissors", "Multiplication Table",
                          or "Caesar Cipher").
         """
+        # Build solution frame on first selection, builders register it in _solution_frames
+        if title not in self._solution_frames:
+            self._frame_builders[title]()
+
         # Forget title frame and reconfigure
         self.title_frame.grid_forget()
-        self.title_label.configure(text=title)
-        self.title_image.configure(image=self.icons[title][(50, 50)])
-        
+        self.title_label.configure(text=title, font=self._title_fonts[title])
+        self.title_image.configure(image=self._title_icons.get(title))
+
         # Display frames according to solution
-        if title == "Rock Paper Scissors":
-            self.title_label.configure(font=ctk.CTkFont(size=33, family="Silkscreen", weight="bold"))
-            self.mt_frame.grid_forget()
-            self.cc_frame.grid_forget()
-            self.rps_frame.grid(row=1, column=0, padx=0, pady=0, sticky="nsew")
-        elif title == "Multiplication Table":
-            self.title_label.configure(font=ctk.CTkFont(size=38, family="Britannic Bold"))
-            self.rps_frame.grid_forget()
-            self.cc_frame.grid_forget()
-            self.mt_frame.grid(row=1, column=0, padx=0, pady=0, sticky="nsew")
-        elif title == "Caesar Cipher":
-            self.title_label.configure(font=ctk.CTkFont(size=36, family="Caesar Dressing"))
-            self.rps_frame.grid_forget()
-            self.mt_frame.grid_forget()
-            self.cc_frame.grid(row=1, column=0, padx=0, pady=0, sticky="nsew")
+        for name, frame in self._solution_frames.items():
+            if name != title:
+                frame.grid_forget()
+        self._solution_frames[title].grid(row=1, column=0, padx=0, pady=0, sticky="nsew")
         
         # Display configured title frame 
         self.title_frame.grid(row=0, column=0, padx=0, pady=0, sticky="new")
@@ -560,55 +734,48 @@ class Gui(ctk.CTk):
         Args:
             screen (str): The screen configuration to be displayed ("login", "game", or "postgame").
         """
-        if screen == "login":
-            # Clear entry fields
-            self.rps_entry_p1name.delete(0, END)
-            self.rps_entry_p2name.delete(0, END)
-            # Forget game frame and show login frame
-            self.rps_frame_game.grid_forget()
-            self.rps_frame_login.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
-        elif screen == "game":
-            # Reset widgets for new round
-            self.update_rps_segbutton("p1", "enabled")
-            self.update_rps_segbutton("p2", "enabled")
-            self.update_rps_image("p1", "Waiting")
-            self.update_rps_image("p2", "Waiting")
-            # Forget login frame and postgame msg frame in case of replay rounds
-            self.rps_frame_login.grid_forget()
-            self.rps_frame_postgame_msg.grid_forget()
-            # Show game frame and game msg frame
-            self.rps_frame_game_msg.grid(row=4, column=0, columnspan=3, padx=0, pady=(10, 0), sticky="nsew")
-            self.rps_frame_game.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
-        elif screen == "postgame":
-            # Switch from game msg frame to postgame msg frame
-            self.rps_frame_game_msg.grid_forget()
-            self.rps_frame_postgame_msg.grid(row=4, column=0, columnspan=3, padx=0, pady=(10, 0), sticky="nsew")            
+        self._rps_screens[screen]()
+
+    def _show_rps_login(self):
+        """Shows the login frame of the Rock Paper Scissors screen."""
+        # Clear entry fields
+        self.rps_entry_p1name.delete(0, END)
+        self.rps_entry_p2name.delete(0, END)
+        # Forget game frame and show login frame
+        self.rps_frame_game.grid_forget()
+        self.rps_frame_login.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
+
+    def _show_rps_game(self):
+        """Shows the game frame of the Rock Paper Scissors screen with widgets reset."""
+        # Reset widgets for new round
+        self.update_rps_segbutton("p1", "enabled")
+        self.update_rps_segbutton("p2", "enabled")
+        self.update_rps_image("p1", "Waiting")
+        self.update_rps_image("p2", "Waiting")
+        # Forget login frame and postgame msg frame in case of replay rounds
+        self.rps_frame_login.grid_forget()
+        self.rps_frame_postgame_msg.grid_forget()
+        # Show game frame and game msg frame
+        self.rps_frame_game_msg.grid(row=4, column=0, columnspan=3, padx=0, pady=(10, 0), sticky="nsew")
+        self.rps_frame_game.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
+
+    def _show_rps_postgame(self):
+        """Shows the postgame msg frame of the Rock Paper Scissors screen."""
+        # Switch from game msg frame to postgame msg frame
+        self.rps_frame_game_msg.grid_forget()
+        self.rps_frame_postgame_msg.grid(row=4, column=0, columnspan=3, padx=0, pady=(10, 0), sticky="nsew")
 
     def update_msg(self, msg, frame, type):
-        """Updates the msg section of the Rock Paper Scissors screen.
+        """Updates the msg section of any solution screen.
 
         Args:
             msg (str): The message to be displayed.
-            frame (str): The msg frame to display the message in ("login", "game", or "postgame").
+            frame (str): The msg frame to display the message in ("rps_login", "rps_game",
+                         "rps_postgame", "mt", or "cc").
             type (str): The type of message, determining text color ("error", or "system")
         """
-        # Color text by type of msg
-        if type == "error":
-            color = self.RED
-        elif type == "system":
-            color = self.GREEN
-        
-        # Choice of msg frame to update    
-        if frame == "rps_login":
-            self.rps_msg_login.configure(text=msg, text_color=color)         
-        elif frame == "rps_game":
-            self.rps_msg_game.configure(text=msg, text_color=color)  
-        elif frame == "rps_postgame":
-            self.rps_msg_postgame.configure(text=msg, text_color=color)
-        elif frame == "mt":
-            self.mt_msg.configure(text=msg, text_color=color)
-        elif frame == "cc":
-            self.cc_msg.configure(text=msg, text_color=color)          
+        # Choice of msg frame to update and text color by type of msg
+        self._msg_labels[frame].configure(text=msg, text_color=self._MSG_COLORS[type])
 
     def update_rps_image(self, player, output):
         """Updates the image section of the Rock Paper Scissors screen.
@@ -617,24 +784,10 @@ class Gui(ctk.CTk):
             player (str): The players' image to update ("p1", or "p2").
             output (str): The image to be output ("Waiting", "?", "Rock", "Paper", or "Scissors").
         """
-        if player == "p1":
-            if output == "Waiting":
-                self.rps_image_p1choice.configure(text="Waiting for input...", image=self.image_blank,
-                                                  font=ctk.CTkFont(size=14, family="Silkscreen"))
-            elif output == "?":
-                self.rps_image_p1choice.configure(text="?", 
-                         font=ctk.CTkFont(size=50, family="Silkscreen", weight="bold"))
-            elif output == "Rock" or "Paper" or "Scissors":
-                self.rps_image_p1choice.configure(text="", image=self.rps_images[player][output])
-        elif player == "p2":
-            if output == "Waiting":
-                self.rps_image_p2choice.configure(text="Waiting for input...", image=self.image_blank,
-                                                  font=ctk.CTkFont(size=14, family="Silkscreen"))
-            elif output == "?":
-                self.rps_image_p2choice.configure(text="?", 
-                         font=ctk.CTkFont(size=50, family="Silkscreen", weight="bold"))
-            elif output == "Rock" or "Paper" or "Scissors":
-                self.rps_image_p2choice.configure(text="", image=self.rps_images[player][output])
+        # Outputs other than those configured are ignored
+        config = self._rps_image_configs[player].get(output)
+        if config is not None:
+            self._rps_image_labels[player].configure(**config)
 
     def update_rps_name(self, player, name):
         """Updates the player name labels of the Rock Paper Scissors screen.
@@ -643,10 +796,7 @@ class Gui(ctk.CTk):
             player (str): The players' name to update ("p1", or "p2").
             name (str): The name to be output.
         """
-        if player == "p1":
-            self.rps_label_p1name.configure(text=name)
-        elif player == "p2":
-            self.rps_label_p2name.configure(text=name)
+        self._rps_name_labels[player].configure(text=name)
 
     def update_rps_score(self, player, score):
         """Updates the player score labels of the Rock Paper Scissors screen.
@@ -655,10 +805,7 @@ class Gui(ctk.CTk):
             player (str): The players' score to update ("p1", or "p2").
             score (str): The score to be output.
         """
-        if player == "p1":
-            self.rps_label_p1score.configure(text=f"Score: {score}")
-        elif player == "p2":
-            self.rps_label_p2score.configure(text=f"Score: {score}")
+        self._rps_score_labels[player].configure(text=f"Score: {score}")
 
     def update_rps_segbutton(self, player, state):
         """Updates the segmented buttons of the Rock Paper Scissors screen.
@@ -667,18 +814,12 @@ class Gui(ctk.CTk):
             player (str): The players' button state to update ("p1", or "p2").
             state (str): The state of the button to change to ("enabled", or "disabled")
         """
-        if player == "p1":
-            if state == "enabled":
-                self.rps_segbutton_p1.configure(state="normal")
-            elif state == "disabled":
-                self.rps_segbutton_p1.set("deselect")
-                self.rps_segbutton_p1.configure(state="disabled")
-        elif player == "p2":
-            if state == "enabled":
-                self.rps_segbutton_p2.configure(state="normal")
-            elif state == "disabled":
-                self.rps_segbutton_p2.set("deselect")
-                self.rps_segbutton_p2.configure(state="disabled")
+        segbutton = self._rps_segbuttons[player]
+        if state == "enabled":
+            segbutton.configure(state="normal")
+        elif state == "disabled":
+            segbutton.set("deselect")
+            segbutton.configure(state="disabled")
         
     def update_mt_textbox(self, text):
         """Updates the textbox of the Multiplication Table screen.
@@ -686,12 +827,9 @@ class Gui(ctk.CTk):
         Args:
             text (str): The text to be displayed.
         """
-        # Enable textbox and clear out contents
+        # Enable textbox and replace contents in one Tk call, CTkTextbox does not wrap replace()
         self.mt_textbox.configure(state="normal")
-        self.mt_textbox.delete("0.0", END)
-        # If text is provided, insert into textbox
-        if text:
-            self.mt_textbox.insert(END, text)
+        self.mt_textbox._textbox.replace("1.0", END, text or "")
         self.mt_textbox.configure(state="disabled")
     
     def update_cc_textbox(self, text, output):
@@ -701,12 +839,8 @@ class Gui(ctk.CTk):
             text (str): The text to be displayed.
             output (str): The type of text to be displayed ("ptext", or "ctext").
         """
-        if output == "ptext":
-            self.cc_textbox_ptext.delete(0.0, END)
-            self.cc_textbox_ptext.insert(END, text)
-        elif output == "ctext":
-            self.cc_textbox_ctext.delete(0.0, END)
-            self.cc_textbox_ctext.insert(END, text)  
+        # Replace contents in one Tk call, CTkTextbox does not wrap replace()
+        self._cc_textboxes[output]._textbox.replace("1.0", END, text)
         
     def update_mt_slider(self, value):
         """Updates the displayed tooltip value of the Multiplication Table range slider.
@@ -714,7 +848,21 @@ class Gui(ctk.CTk):
         Args:
             value (int): The value to display on the slider.
         """
-        self.mt_slider_tooltip.configure(message=int(value))          
+        if self.mt_slider_tooltip is not None:
+            self.mt_slider_tooltip.configure(message=int(value))
+
+    def _ensure_mt_tooltip(self, event):
+        """Creates the Multiplication Table range slider tooltip on first hover.
+
+        CTk widgets cannot unbind a single callback, so later calls return immediately.
+
+        Args:
+            event (tkinter.Event): The <Enter> event of the slider.
+        """
+        if self.mt_slider_tooltip is None:
+            self.mt_slider_tooltip = CTkToolTip(self.mt_slider_multiplicand, 
+                                                message=int(self.mt_slider_multiplicand.get()),
+                                                font=self._font("Silkscreen", 10))          
 
 
 class RockPaperScissors:
@@ -737,6 +885,9 @@ class RockPaperScissors:
         results(): Calculates and displays results of a round of Rock Paper Scissors.
     """
 
+    # Numeric value of each choice used to calculate results
+    _CHOICES = {"Rock": 0, "Paper": 1, "Scissors": 2}
+
     def __init__(self, gui):
         """Initializes the RockPaperScissors instance.
         
@@ -770,10 +921,7 @@ class RockPaperScissors:
         
         # Validate entry fields and switch to game screen
         if invalid_fields:
-            error_message = " & ".join(invalid_fields)
-            self.gui.update_msg(f"Input Error: Please ensure all fields have correct input\n"
-                                f"Fields: {error_message}", 
-                                "rps_login", "error")
+            self.gui.update_msg(_ERR_PREFIX + " & ".join(invalid_fields), "rps_login", "error")
         else:
             self.gui.update_rps_name("p1", self.p1name)
             self.gui.update_rps_name("p2", self.p2name)
@@ -832,8 +980,7 @@ class RockPaperScissors:
         Displays player choices and post-game options.
         """
         # Calculate result using modulus method
-        choices = {"Rock": 0, "Paper": 1, "Scissors": 2}
-        result = (choices[self.p1choice] - choices[self.p2choice]) % 3
+        result = (self._CHOICES[self.p1choice] - self._CHOICES[self.p2choice]) % 3
 
         # Determine winner, increment score, and display results message
         if result == 0:
@@ -905,18 +1052,17 @@ class MultiplicationTable:
         
         # Validate user input and update output fields
         if invalid_fields:
-            error_message = " & ".join(invalid_fields)
-            self.gui.update_msg(f"Input Error: Please ensure all fields have correct input\n"
-                                f"Fields: {error_message}", 
-                                "mt", "error")
+            self.gui.update_msg(_ERR_PREFIX + " & ".join(invalid_fields), "mt", "error")
         else:
             self.multiplier = int(self.multiplier)
                 
-            # Generate the multiplication table for every multiplicand in the chosen range
-            text += f"{self.username}'s Table:\n\n"
-            for multiplicand in range(1, self.multiplicand + 1):
-                product = multiplicand * self.multiplier
-                text += f"{multiplicand} x {self.multiplier} = {product}\n"
+            # Generate the multiplication table for every multiplicand in the chosen range,
+            # joining the lines once rather than concatenating per line
+            multiplier = self.multiplier
+            lines = [f"{self.username}'s Table:\n"]
+            lines += [f"{multiplicand} x {multiplier} = {multiplicand * multiplier}"
+                      for multiplicand in range(1, self.multiplicand + 1)]
+            text = "\n".join(lines) + "\n"
                 
             # Display the success msg
             self.gui.update_msg("Multiplication Table has been generated\n" +
@@ -934,11 +1080,7 @@ class MultiplicationTable:
         Returns:
             return (bool): True or false, is value an integer.
         """
-        try:
-            int(value)
-            return True
-        except ValueError:
-            return False
+        return _INTEGER.fullmatch(value) is not None
         
         
 class CaesarCipher:
@@ -946,7 +1088,7 @@ class CaesarCipher:
 
     Attributes:
         gui (Gui): Reference to the shared Gui instance.
-        cipherkey (str): Key that will determine the alpha shift.
+        cipherkey (str | int): Key that will determine the alpha shift, reduced to 0-25 once validated.
         plaintext (str): Message to be encrypted, or decrypted message.
         ciphertext (str): Encrypted message, or message to be decrypted.
 
@@ -967,6 +1109,8 @@ class CaesarCipher:
         self.cipherkey = None
         self.plaintext = None
         self.ciphertext = None
+        # Translation tables keyed by (direction, shift), see caesar_cipher()
+        self._table_cache = {}
         
     def encrypt(self):
         """Handles retrieval of plaintext and cipher key for encryption.
@@ -975,7 +1119,7 @@ class CaesarCipher:
         """
         # Get input variables from entry fields
         self.cipherkey = self.gui.cc_entry_key.get()
-        self.plaintext = self.gui.cc_textbox_ptext.get(0.0, END).strip().upper()
+        self.plaintext = self.gui.cc_textbox_ptext.get(0.0, END).strip()
               
         self.ciphertext = ""      
               
@@ -988,16 +1132,15 @@ class CaesarCipher:
         
         # Validate user input and update output fields
         if invalid_fields:
-            error_message = " & ".join(invalid_fields)
-            self.gui.update_msg(f"Input Error: Please ensure all fields have correct input\n"
-                                f"Fields: {error_message}", 
-                                "cc", "error")
+            self.gui.update_msg(_ERR_PREFIX + " & ".join(invalid_fields), "cc", "error")
         else:    
+            # Reduce the cipher key to its alpha shift once, a multiple of 26 leaves text unchanged
+            self.cipherkey = self.validate_key(self.cipherkey) % 26
             # Encrypt the plaintext into cyphertext
             self.ciphertext = self.caesar_cipher(self.plaintext, "encrypt")
             
             # Display the success msg / result of using a multiple of 26 as a key
-            if self.cipherkey % 26 == 0:
+            if self.cipherkey == 0:
                 self.gui.update_msg("Using a cipher key divisible by 26 results in no change!\n" +
                                     "Alpha characters remain unchanged", "cc", "error")
             else:
@@ -1014,7 +1157,7 @@ class CaesarCipher:
         """
         # Get input variables from entry fields
         self.cipherkey = self.gui.cc_entry_key.get()
-        self.ciphertext = self.gui.cc_textbox_ctext.get(0.0, END).strip().upper()
+        self.ciphertext = self.gui.cc_textbox_ctext.get(0.0, END).strip()
         
         self.plaintext = ""
         
@@ -1024,21 +1167,20 @@ class CaesarCipher:
             invalid_fields.append("Cipher key empty")
         if not self.ciphertext:
             invalid_fields.append("Ciphertext empty")
-        if not self.ciphertext.isalpha():
+        if not (self.ciphertext.isascii() and self.ciphertext.isalpha()):
             invalid_fields.append("Ciphertext contains non-alpha")
         
         # Validate user input and update output fields
         if invalid_fields:
-            error_message = " & ".join(invalid_fields)
-            self.gui.update_msg(f"Input Error: Please ensure all fields have correct input\n"
-                                f"Fields: {error_message}", 
-                                "cc", "error")
+            self.gui.update_msg(_ERR_PREFIX + " & ".join(invalid_fields), "cc", "error")
         else:
+            # Reduce the cipher key to its alpha shift once, a multiple of 26 leaves text unchanged
+            self.cipherkey = self.validate_key(self.cipherkey) % 26
             # Decrypt the cyphertext into plaintext
             self.plaintext = self.caesar_cipher(self.ciphertext, "decrypt")
             
             # Display the success msg / result of using a multiple of 26 as a key
-            if self.cipherkey % 26 == 0:
+            if self.cipherkey == 0:
                 self.gui.update_msg("Using a cipher key divisible by 26 results in no change!\n" +
                                     "Alpha characters remain unchanged", "cc", "error")
             else:
@@ -1051,7 +1193,7 @@ class CaesarCipher:
     def caesar_cipher(self, text, dir):
         """Uses a cipher key to encrypt and decrypt plaintext and ciphertext.
         
-        Converts only letters using ASCII values and modulus.
+        Converts only letters A-Z of either case using a translation table shifted by the cipher key.
         Removes all non-alpha characters and replaces "." with "X"
         
         Args:
@@ -1061,29 +1203,21 @@ class CaesarCipher:
         Returns:
             result (str): The encrypted/decrypted text.
         """
-        result = ""
+        # Translation table mapping each upper and lowercase letter to the uppercase letter
+        # shifted by the cipher key, and full stop to the shifted "X". The cipher key is already
+        # reduced % 26 by the caller so the cipher loops the alphabetic range. Tables are cached
+        # by direction and shift as the same key is usually used many times
+        shift = self.cipherkey
+        table = self._table_cache.get((dir, shift))
+        if table is None:
+            offset = shift if dir == "encrypt" else -shift % 26
+            shifted = string.ascii_uppercase[offset:] + string.ascii_uppercase[:offset]
+            table = self._table_cache[(dir, shift)] = str.maketrans(
+                string.ascii_uppercase + string.ascii_lowercase + ".",
+                shifted + shifted + shifted[string.ascii_uppercase.index("X")])
         
-        self.cipherkey = self.validate_key(self.cipherkey)
-        
-        for char in text.upper():
-            # Only encrypt/decrypt letters and full stop, removing non-alpha characters
-            if char.isalpha() or char ==".":
-                # Change full stop to "X"
-                if char == ".":
-                    char = "X"
-                # Gets ASCII value of "A" to use as baseline
-                base = ord("A")
-                # Substracts base from char and adds the cipherkey, giving alpha<->numeric representation
-                # of modified char. Using % 26 ensures the cipher loops the alphabetic range.       
-                # Adding the base aligns alpha<->numeric representation (1-26) with ASCII values of A-Z
-                if dir == "encrypt":
-                    modified_char = chr(((ord(char) - base + self.cipherkey) % 26) + base)
-                elif dir == "decrypt":
-                    modified_char = chr(((ord(char) - base - self.cipherkey) % 26) + base)  
-                
-                result += modified_char
-                
-        return result
+        # Only encrypt/decrypt letters and full stop, then remove non-alpha characters
+        return _NON_ALPHA.sub("", text.translate(table))
     
     def validate_key(self, key):
         """Ensures caesar cipher key is valid.
@@ -1094,16 +1228,12 @@ class CaesarCipher:
             key (str): The cipher key to be validated/converted.
             
         Returns:
-            int_key (int): True or false, is value an integer.
+            int_key (int): The cipher key as an integer.
         """
-        int_key = 0 
-        try:
-            int_key = int(key)
-        except:
-            # For every character in key string, adds ASCII value to int_key
-            for char in key:
-                int_key += ord(char)
-        return int_key
+        if _INTEGER.fullmatch(key):
+            return int(key)
+        # Otherwise sums the ASCII value of every character in key string
+        return sum(map(ord, key))
    
      
 class App:
@@ -1118,8 +1248,12 @@ class App:
 
     Methods:
         select_solution(): Handles menu item selection.
-        on_exit(): Handles application exit.
+        wire_rps(): Defines button commands and bindings of the Rock Paper Scissors screen.
+        wire_mt(): Defines button commands and bindings of the Multiplication Table screen.
+        wire_cc(): Defines button commands and bindings of the Caesar Cipher screen.
     """
+    __slots__ = ("gui", "rps", "mt", "cc", "selected_solution", "_menu_button_refs", "_selected_button",
+                 "_c_dark", "_c_blue", "_wired", "_wiring")
 
     def __init__(self):
         """Initializes the App class.
@@ -1135,45 +1269,28 @@ class App:
         # Indicates the solution selected from menu sidebar
         self.selected_solution = None
         
+        # Menu buttons and highlight colors resolved once for select_solution()
+        self._menu_button_refs = self.gui.menu_buttons.copy()
+        self._selected_button = None
+        self._c_dark = self.gui.DARKNESS
+        self._c_blue = self.gui.BLUE
+        
+        # Indicates the solutions whose widgets have been wired, see select_solution()
+        self._wired = set()
+        self._wiring = {
+            "Rock Paper Scissors": self.wire_rps,
+            "Multiplication Table": self.wire_mt,
+            "Caesar Cipher": self.wire_cc
+        }
+
         # Gui widget commands and bindings
         for solution_name, menu_button in self.gui.menu_buttons.items():
-            menu_button.configure(command=lambda name=solution_name: (self.select_solution(name), 
-                                                                      menu_button.focus_set()))
-        self.gui.menu_button_exit.configure(command=self.on_exit)
-        # Rock Paper Scissors
-        self.gui.rps_button_start.configure(command=lambda: (self.gui.rps_button_start.focus_set(),
-                                                             self.rps.start()))
-        self.gui.rps_entry_p1name.bind("<Return>", lambda event: (self.gui.rps_button_start.focus_set(),
-                                                                  self.rps.start()))
-        self.gui.rps_entry_p2name.bind("<Return>", lambda event: (self.gui.rps_button_start.focus_set(),
-                                                                  self.rps.start()))
-        self.gui.rps_button_quit1.configure(command=lambda: (self.gui.rps_button_quit1.focus_set(),
-                                                             self.rps.quit()))
-        self.gui.rps_button_quit2.configure(command=lambda: (self.gui.rps_button_quit2.focus_set(),
-                                                             self.rps.quit()))
-        self.gui.rps_button_replay.configure(command=lambda: (self.gui.rps_button_replay.focus_set(),
-                                                              self.rps.replay()))
-        self.gui.rps_segbutton_p1.configure(command=lambda value, 
-                                            player="p1": (self.gui.rps_segbutton_p1.focus_set(),
-                                                          self.rps.select(value, player)))
-        self.gui.rps_segbutton_p2.configure(command=lambda value, 
-                                            player="p2": (self.gui.rps_segbutton_p2.focus_set(),
-                                                          self.rps.select(value, player)))
-        # Multiplication Table
-        self.gui.mt_button_generate.configure(command=lambda: (self.gui.mt_button_generate.focus_set(),
-                                                               self.mt.generate()))
-        self.gui.mt_entry_user.bind("<Return>", lambda event: (self.gui.mt_button_generate.focus_set(),
-                                                               self.mt.generate()))
-        self.gui.mt_entry_multiplier.bind("<Return>", lambda event: (self.gui.mt_button_generate.focus_set(),
-                                                                     self.mt.generate()))
-        # Caesar Cipher
-        self.gui.cc_button_encode.configure(command=lambda: (self.gui.cc_button_encode.focus_set(),
-                                                             self.cc.encrypt()))
-        self.gui.cc_button_decode.configure(command=lambda: (self.gui.cc_button_decode.focus_set(),
-                                                             self.cc.decrypt()))
+            menu_button.configure(command=_FocusCommand(menu_button,
+                                                        functools.partial(self.select_solution, solution_name)))
+        self.gui.menu_button_exit.configure(command=self.gui.destroy)
         
-        # Enables function on exit and safely close threads
-        self.gui.protocol("WM_DELETE_WINDOW", self.on_exit)
+        # Destroys the window directly on exit, there is no other cleanup to run
+        self.gui.protocol("WM_DELETE_WINDOW", self.gui.destroy)
 
     def select_solution(self, solution_name):
         """Event handler for the menu buttons on the menu frame.
@@ -1183,19 +1300,69 @@ class App:
         Args:
             solution_name (str): The name of the selected solution.
         """
-        # If there is a previously selected solution, set color to default
-        if self.selected_solution is not None:
-            self.gui.menu_buttons.get(self.selected_solution).configure(fg_color=self.gui.DARKNESS)
+        # Re-selecting the shown solution leaves the screen unchanged
+        if solution_name == self.selected_solution:
+            return
+        
+        button = self._menu_button_refs[solution_name]
+        
+        # If there is a previously selected menu button, set color to default
+        if self._selected_button is not None:
+            self._selected_button.configure(fg_color=self._c_dark)
             
         # Set color to highlighted and show the selected solution screen
-        self.gui.menu_buttons.get(solution_name).configure(fg_color=self.gui.BLUE)
+        button.configure(fg_color=self._c_blue)
+        self._selected_button = button
         self.selected_solution = solution_name
         self.gui.show_solution(self.selected_solution)
 
-    def on_exit(self):
-        """Called when the program is exited.
+        # Wire solution widgets once their frame has been built
+        if solution_name not in self._wired:
+            self._wiring[solution_name]()
+            self._wired.add(solution_name)
+
+    def _wire_commands(self, commands):
+        """Sets widget commands that focus the widget, and binds <Return> on entries to them.
+
+        Args:
+            commands (tuple): (widget, action, entries) rows, where entries trigger the widget
+                              command when <Return> is pressed.
+        """
+        for widget, action, entries in commands:
+            command = _FocusCommand(widget, action)
+            widget.configure(command=command)
+            for entry in entries:
+                entry.bind("<Return>", command.on_event)
+
+    def wire_rps(self):
+        """Defines button commands and bindings of the Rock Paper Scissors screen.
+        """
+        gui, rps = self.gui, self.rps
+        self._wire_commands((
+            (gui.rps_button_start, rps.start, (gui.rps_entry_p1name, gui.rps_entry_p2name)),
+            (gui.rps_button_quit1, rps.quit, ()),
+            (gui.rps_button_quit2, rps.quit, ()),
+            (gui.rps_button_replay, rps.replay, ()),
+            (gui.rps_segbutton_p1, functools.partial(rps.select, player="p1"), ()),
+            (gui.rps_segbutton_p2, functools.partial(rps.select, player="p2"), ())
+        ))
+
+    def wire_mt(self):
+        """Defines button commands and bindings of the Multiplication Table screen.
+        """
+        gui = self.gui
+        self._wire_commands((
+            (gui.mt_button_generate, self.mt.generate, (gui.mt_entry_user, gui.mt_entry_multiplier)),
+        ))
+
+    def wire_cc(self):
+        """Defines button commands and bindings of the Caesar Cipher screen.
         """
-        self.gui.destroy()
+        gui = self.gui
+        self._wire_commands((
+            (gui.cc_button_encode, self.cc.encrypt, ()),
+            (gui.cc_button_decode, self.cc.decrypt, ())
+        ))
 
 
 if __name__ == "__main__":